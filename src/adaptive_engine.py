@@ -1,6 +1,8 @@
-import numpy as np
-from typing import List
+from bisect import bisect_left
+from functools import lru_cache
+from typing import List, Tuple
 from dataclasses import dataclass, field
+from puzzle_generator import DifficultyLevel
 
 @dataclass
 class AdaptationConfig:
@@ -9,38 +11,127 @@ class AdaptationConfig:
     lookback_window: int = 5
     min_attempts_before_change: int = 3
 
+# Fixed rule constants used by _decide. The decision table's band
+# breakpoints (AdaptiveEngine.ACCURACY_BREAKPOINTS / TIME_BREAKPOINTS) are
+# built from these same names, so the two can't drift apart.
+FAST_TIME = 10          # seconds; strong increase below this
+SLOW_TIME = 20          # seconds; strong decrease above this
+MILD_UP_ACCURACY = 65   # percent; mild increase above this...
+MILD_UP_TIME = 12       # ...when faster than this
+MILD_DOWN_ACCURACY = 45 # percent; mild decrease below this...
+MILD_DOWN_TIME = 18     # ...or when slower than this
+
+def _decide(accuracy: float, avg_time: float, level: int, high: float, low: float) -> int:
+    """Evaluate the adaptation rules for a 0-based level"""
+    if accuracy >= high and avg_time < FAST_TIME:
+        # Doing well - increase difficulty
+        return min(level + 1, 2)  # Cap at HARD
+    if accuracy <= low or avg_time > SLOW_TIME:
+        # Struggling - decrease difficulty
+        return max(level - 1, 0)  # Floor at EASY
+    # Medium performance - stay or slight adjustment
+    if accuracy > MILD_UP_ACCURACY and avg_time < MILD_UP_TIME:
+        return min(level + 1, 2)
+    if accuracy < MILD_DOWN_ACCURACY or avg_time > MILD_DOWN_TIME:
+        return max(level - 1, 0)
+    return level
+
+@lru_cache(maxsize=None)
+def _batch_kernel():
+    """
+    Element-wise _decide over arrays, writing next levels into out.
+    Built on first use so importing the engine doesn't pull in numba;
+    JIT-compiled and parallelised when numba is installed.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba is optional; run as plain Python
+        njit, prange = None, range
+    
+    decide = _decide if njit is None else njit(cache=True)(_decide)
+    
+    def decide_batch(accuracy, avg_time, level, high, low, out):
+        for i in prange(len(level)):
+            out[i] = decide(accuracy[i], avg_time[i], level[i], high, low)
+        return out
+    
+    return decide_batch if njit is None else njit(cache=True, parallel=True)(decide_batch)
+
+def _band(value: float, breakpoints: List[float]) -> int:
+    """
+    Index of the band containing value, where sorted breakpoints b0 < b1 < ...
+    split the line into bands (-inf, b0), [b0], (b0, b1), [b1], ..., (bn, inf)
+    """
+    i = bisect_left(breakpoints, value)
+    if i < len(breakpoints) and breakpoints[i] == value:
+        return 2 * i + 1
+    return 2 * i
+
+def _band_points(breakpoints: List[float]) -> List[float]:
+    """One representative value per band, in band order"""
+    points = [breakpoints[0] - 1]
+    for lo, hi in zip(breakpoints, breakpoints[1:]):
+        points += [lo, (lo + hi) / 2]
+    points += [breakpoints[-1], breakpoints[-1] + 1]
+    return points
+
+@lru_cache(maxsize=32)
+def _decision_table(acc_breaks: Tuple[float, ...], time_breaks: Tuple[float, ...],
+                    high: float, low: float) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    Precompute _decide for every (accuracy band, time band, level).
+    Every rule comparison is constant within a band, so looking up the
+    band gives exactly the same result as evaluating the rules.
+    Cached so engines sharing a config share one (immutable) table.
+    """
+    return tuple(
+        tuple(
+            tuple(_decide(accuracy, avg_time, level, high, low) for level in range(len(DifficultyLevel)))
+            for avg_time in _band_points(time_breaks)
+        )
+        for accuracy in _band_points(acc_breaks)
+    )
+
 class AdaptiveEngine:
     """
     Manages difficulty adaptation using rule-based approach
     """
     
-    DIFFICULTY_LEVELS = ['EASY', 'MEDIUM', 'HARD']
-    DIFFICULTY_MAP = {'EASY': 0, 'MEDIUM': 1, 'HARD': 2}
-    REVERSE_MAP = {0: 'EASY', 1: 'MEDIUM', 2: 'HARD'}
+    # Fixed constants compared against in _decide; the configured
+    # high/low accuracy thresholds are added per instance
+    ACCURACY_BREAKPOINTS = (MILD_DOWN_ACCURACY, MILD_UP_ACCURACY)
+    TIME_BREAKPOINTS = (FAST_TIME, MILD_UP_TIME, MILD_DOWN_TIME, SLOW_TIME)
     
     def __init__(self, config: AdaptationConfig = None):
         self.config = config or AdaptationConfig()
         self.attempt_count = 0
         self.history = []  # Track adaptation history
+        
+        thresholds = self.config.rule_based_thresholds
+        high, low = thresholds['high'], thresholds['low']
+        self._acc_breaks = tuple(sorted({high, low, *self.ACCURACY_BREAKPOINTS}))
+        self._time_breaks = tuple(sorted(set(self.TIME_BREAKPOINTS)))
+        self._table = _decision_table(self._acc_breaks, self._time_breaks, high, low)
     
-    def get_next_difficulty(self, current_difficulty: str, 
-                           recent_performance: List[bool],
-                           recent_times: List[float]) -> str:
+    def get_next_difficulty(self, current_difficulty: DifficultyLevel, 
+                           accuracy: float, avg_time: float,
+                           attempts: int) -> DifficultyLevel:
         """
         Determine next difficulty level based on recent performance
         
         Args:
-            current_difficulty: Current difficulty level ('EASY', 'MEDIUM', 'HARD')
-            recent_performance: List of boolean values (True=correct, False=incorrect)
-            recent_times: List of time taken for each attempt (in seconds)
+            current_difficulty: Current difficulty level
+            accuracy: Accuracy percentage over the recent window
+            avg_time: Average time per attempt over the recent window (in seconds)
+            attempts: Number of attempts in the recent window
         
         Returns:
-            Next difficulty level as string
+            Next difficulty level
         """
         self.attempt_count += 1
         
         next_diff = self._adapt_rule_based(
-            current_difficulty, recent_performance, recent_times
+            current_difficulty, accuracy, avg_time, attempts
         )
         
         # Log adaptation
@@ -48,15 +139,15 @@ class AdaptiveEngine:
             'attempt': self.attempt_count,
             'from': current_difficulty,
             'to': next_diff,
-            'accuracy': (sum(recent_performance) / len(recent_performance) * 100) if recent_performance else 0,
-            'avg_time': np.mean(recent_times) if recent_times else 0
+            'accuracy': accuracy,
+            'avg_time': avg_time
         })
         
         return next_diff
     
-    def _adapt_rule_based(self, current_difficulty: str, 
-                         recent_performance: List[bool],
-                         recent_times: List[float]) -> str:
+    def _adapt_rule_based(self, current_difficulty: DifficultyLevel, 
+                         accuracy: float, avg_time: float,
+                         attempts: int) -> DifficultyLevel:
         """
         Rule-based adaptation logic:
         - High accuracy (>75%) + fast time → increase difficulty
@@ -65,42 +156,62 @@ class AdaptiveEngine:
         
         Args:
             current_difficulty: Current difficulty level
-            recent_performance: Recent attempt results
-            recent_times: Recent time measurements
+            accuracy: Recent accuracy percentage
+            avg_time: Recent average time (in seconds)
+            attempts: Number of recent attempts
         
         Returns:
             Next difficulty level
         """
-        if not recent_performance:
+        if not attempts:
             return current_difficulty
         
         # Only adapt after minimum attempts
-        if len(recent_performance) < self.config.min_attempts_before_change:
+        if attempts < self.config.min_attempts_before_change:
             return current_difficulty
         
-        accuracy = (sum(recent_performance) / len(recent_performance)) * 100
-        avg_time = np.mean(recent_times) if recent_times else float('inf')
+        acc_band = _band(accuracy, self._acc_breaks)
+        time_band = _band(avg_time, self._time_breaks)
+        next_level = self._table[acc_band][time_band][current_difficulty - 1]
+        return DifficultyLevel(next_level + 1)
+    
+    def decide_batch(self, accuracy, avg_time, levels):
+        """
+        Next levels for many learners at once (e.g. offline simulations).
+        Applies the rules only: no minimum-attempts check and no history.
+        Requires numpy; numba is used when installed.
+        
+        Args:
+            accuracy: Accuracy percentages
+            avg_time: Average times (in seconds)
+            levels: Current difficulty levels as DifficultyLevel values (1..3)
         
-        thresholds = self.config.rule_based_thresholds
-        current_level = self.DIFFICULTY_MAP[current_difficulty]
+        Returns:
+            Array of next difficulty levels as DifficultyLevel values (1..3)
+        """
+        import numpy as np
         
-        # Decision logic
-        if accuracy >= thresholds['high'] and avg_time < 10:
-            # Doing well - increase difficulty
-            next_level = min(current_level + 1, 2)  # Cap at HARD
-        elif accuracy <= thresholds['low'] or avg_time > 20:
-            # Struggling - decrease difficulty
-            next_level = max(current_level - 1, 0)  # Floor at EASY
-        else:
-            # Medium performance - stay or slight adjustment
-            if accuracy > 65 and avg_time < 12:
-                next_level = min(current_level + 1, 2)
-            elif accuracy < 45 or avg_time > 18:
-                next_level = max(current_level - 1, 0)
-            else:
-                next_level = current_level
+        accuracy = np.asarray(accuracy, dtype=np.float64)
+        avg_time = np.asarray(avg_time, dtype=np.float64)
+        levels = np.asarray(levels, dtype=np.int64)
+        if not (accuracy.ndim == avg_time.ndim == levels.ndim == 1):
+            raise ValueError("accuracy, avg_time and levels must be 1-D")
+        if not (len(accuracy) == len(avg_time) == len(levels)):
+            raise ValueError("accuracy, avg_time and levels must have the same length")
+        if levels.size and (levels.min() < min(DifficultyLevel) or levels.max() > max(DifficultyLevel)):
+            raise ValueError(f"levels must be DifficultyLevel values "
+                             f"({int(min(DifficultyLevel))}..{int(max(DifficultyLevel))})")
         
-        return self.REVERSE_MAP[next_level]
+        thresholds = self.config.rule_based_thresholds
+        next_levels = _batch_kernel()(
+            accuracy,
+            avg_time,
+            levels - 1,
+            float(thresholds['high']),
+            float(thresholds['low']),
+            np.empty(len(levels), dtype=np.int8)
+        )
+        return next_levels + 1
     
     def get_adaptation_history(self) -> List[dict]:
         """Return history of all adaptations"""
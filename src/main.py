@@ -2,6 +2,7 @@
 Main Application Module
 Console-based interactive adaptive learning system (Rule-Based Only)
 """
+import sys
 import time
 from puzzle_generator import PuzzleGenerator, DifficultyLevel
 from tracker import PerformanceTracker
@@ -35,20 +36,20 @@ class AdaptiveLearningApp:
         while True:
             choice = input("\nEnter (1/2/3): ").strip()
             if choice in ['1', '2', '3']:
-                difficulty_map = {'1': 'EASY', '2': 'MEDIUM', '3': 'HARD'}
+                difficulty_map = {'1': DifficultyLevel.EASY, '2': DifficultyLevel.MEDIUM, '3': DifficultyLevel.HARD}
                 current_difficulty = difficulty_map[choice]
                 break
             print("Invalid choice. Please enter 1, 2, or 3.")
         
-        print(f"\nGreat! Starting with {current_difficulty} level.\n")
+        print(f"\nGreat! Starting with {current_difficulty.name} level.\n")
         
         # Initialize components
         puzzle_gen = PuzzleGenerator()
-        tracker = PerformanceTracker(user_name)
         config = AdaptationConfig(
             rule_based_thresholds={'high': 75, 'low': 50},
             min_attempts_before_change=2
         )
+        tracker = PerformanceTracker(user_name, window_size=config.lookback_window)
         adaptive_engine = AdaptiveEngine(config=config)
         
         puzzle_count = 0
@@ -61,13 +62,14 @@ class AdaptiveLearningApp:
         try:
             while puzzle_count < max_puzzles:
                 # Generate puzzle
-                difficulty_enum = DifficultyLevel[current_difficulty]
-                puzzle = puzzle_gen.generate_puzzle(difficulty_enum)
+                puzzle = puzzle_gen.generate_puzzle(current_difficulty)
                 puzzle_count += 1
                 
-                # Display puzzle
-                print(f"\n[Question {puzzle_count}/{max_puzzles}] ({current_difficulty})")
-                print(f"Problem: {puzzle}")
+                # Display puzzle (input() flushes it along with the prompt)
+                sys.stdout.write(
+                    f"\n[Question {puzzle_count}/{max_puzzles}] ({current_difficulty.name})\n"
+                    f"Problem: {puzzle}\n"
+                )
                 
                 # Get user answer with timeout tracking
                 start_time = time.time()
@@ -87,7 +89,7 @@ class AdaptiveLearningApp:
                 # Check answer
                 is_correct = user_answer == puzzle.correct_answer
                 result = " Correct!" if is_correct else f" Wrong! Correct answer: {puzzle.correct_answer}"
-                print(result)
+                lines = [result]
                 
                 # Log attempt
                 tracker.log_attempt(
@@ -99,26 +101,29 @@ class AdaptiveLearningApp:
                     correct_answer=puzzle.correct_answer
                 )
                 
-                # Get performance trend for adaptation
-                trend = tracker.get_performance_trend(window_size=5)
-                times = [r.time_taken for r in tracker.records[-5:]]
+                # Get recent performance for adaptation
+                window = tracker.window_stats()
+                recent_accuracy = (window.correct_count / window.n) * 100
                 
                 # Adapt difficulty (rule-based only)
                 new_difficulty = adaptive_engine.get_next_difficulty(
                     current_difficulty=current_difficulty,
-                    recent_performance=trend,
-                    recent_times=times
+                    accuracy=recent_accuracy,
+                    avg_time=window.total_time / window.n,
+                    attempts=window.n
                 )
                 
                 # Notify if difficulty changed
                 if new_difficulty != current_difficulty:
-                    print(f" Difficulty adjusted: {current_difficulty} → {new_difficulty}")
+                    lines.append(f" Difficulty adjusted: {current_difficulty.name} → {new_difficulty.name}")
                     current_difficulty = new_difficulty
                 else:
-                    print(f" Keeping {current_difficulty} level")
+                    lines.append(f" Keeping {current_difficulty.name} level")
                 
-                print(f" Time: {elapsed_time:.2f}s | Accuracy (last 5): {tracker.get_accuracy(recent_n=5):.1f}%")
-                print("-" * 70)
+                lines.append(f" Time: {elapsed_time:.2f}s | Accuracy (last {config.lookback_window}): {recent_accuracy:.1f}%")
+                lines.append("-" * 70)
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
         
         except KeyboardInterrupt:
             print("\n\nSession interrupted by user.")
@@ -130,34 +135,38 @@ class AdaptiveLearningApp:
         """Display session summary"""
         summary = tracker.get_session_summary()
         
-        print("\n" + "=" * 70)
-        print("SESSION SUMMARY")
-        print("=" * 70)
-        print(f"\nStudent: {summary['user_name']}")
-        print(f"Total Puzzles: {summary['total_puzzles']}")
-        print(f"Correct Answers: {summary['total_correct']}/{summary['total_puzzles']}")
-        print(f"Overall Accuracy: {summary['overall_accuracy']:.1f}%")
-        print(f"Average Time Per Puzzle: {summary['average_time_per_puzzle']:.2f}s")
-        print(f"Session Duration: {summary['session_duration_seconds']:.1f}s")
-        
-        print("\nPerformance by Difficulty:")
+        # Built up and written in one go rather than a print per line
+        lines = []
+        lines.append("\n" + "=" * 70)
+        lines.append("SESSION SUMMARY")
+        lines.append("=" * 70)
+        lines.append(f"\nStudent: {summary['user_name']}")
+        lines.append(f"Total Puzzles: {summary['total_puzzles']}")
+        lines.append(f"Correct Answers: {summary['total_correct']}/{summary['total_puzzles']}")
+        lines.append(f"Overall Accuracy: {summary['overall_accuracy']:.1f}%")
+        lines.append(f"Average Time Per Puzzle: {summary['average_time_per_puzzle']:.2f}s")
+        lines.append(f"Session Duration: {summary['session_duration_seconds']:.1f}s")
+        
+        lines.append("\nPerformance by Difficulty:")
         for difficulty, stats in summary['difficulty_stats'].items():
-            print(f"  {difficulty}: {stats['accuracy']:.1f}% accuracy ({stats['attempts']} attempts, {stats['avg_time']:.2f}s avg)")
+            lines.append(f"  {difficulty.name}: {stats['accuracy']:.1f}% accuracy ({stats['attempts']} attempts, {stats['avg_time']:.2f}s avg)")
         
-        print("\n Adaptation History:")
+        lines.append("\n Adaptation History:")
         for i, event in enumerate(adaptive_engine.get_adaptation_history()[-10:], 1):
-            print(f"  {i}. Attempt {event['attempt']}: {event['from']} → {event['to']} "
-                  f"(Accuracy: {event['accuracy']:.1f}%, Avg Time: {event['avg_time']:.2f}s)")
+            lines.append(f"  {i}. Attempt {event['attempt']}: {event['from'].name} → {event['to'].name} "
+                         f"(Accuracy: {event['accuracy']:.1f}%, Avg Time: {event['avg_time']:.2f}s)")
         
-        print("\n Recommendation:")
+        lines.append("\n Recommendation:")
         if summary['overall_accuracy'] >= 80:
-            print(f"   Excellent work! You're ready for harder challenges!")
+            lines.append(f"   Excellent work! You're ready for harder challenges!")
         elif summary['overall_accuracy'] >= 60:
-            print(f"   Good progress! Keep practicing to improve!")
+            lines.append(f"   Good progress! Keep practicing to improve!")
         else:
-            print(f"   Keep practicing! You'll get better with more attempts!")
+            lines.append(f"   Keep practicing! You'll get better with more attempts!")
         
-        print("\n" + "=" * 70 + "\n")
+        lines.append("\n" + "=" * 70 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 def main():
     """Entry point"""
@@ -1,14 +1,18 @@
+import operator
 import random
-from enum import Enum
+from enum import IntEnum
 from dataclasses import dataclass
-from typing import Tuple, Literal
+from typing import Dict, Tuple, Literal
 
-class DifficultyLevel(Enum):
+# Non-division operations; division is built divisor-first in PuzzleGenerator
+_APPLY = {'+': operator.add, '-': operator.sub, '*': operator.mul}
+
+class DifficultyLevel(IntEnum):
     EASY = 1
     MEDIUM = 2
     HARD = 3
 
-@dataclass
+@dataclass(slots=True)
 class MathPuzzle:
     """Represents a single math puzzle"""
     operand1: int
@@ -45,27 +49,37 @@ class PuzzleGenerator:
     def __init__(self, seed: int = None):
         if seed is not None:
             random.seed(seed)
+        self._seed = seed
+        self._rng = None  # numpy Generator, created on first bulk request
+        
+        # (min_op, max_op, operations) per difficulty, flattened once
+        self._cfg = {
+            difficulty: (*config['operand_range'], tuple(config['operations']))
+            for difficulty, config in self.DIFFICULTY_CONFIG.items()
+        }
     
     def generate_puzzle(self, difficulty: DifficultyLevel) -> MathPuzzle:
         """Generate a single puzzle for the given difficulty level"""
-        config = self.DIFFICULTY_CONFIG[difficulty]
-        min_op, max_op = config['operand_range']
-        
-        operand1 = random.randint(min_op, max_op)
-        operand2 = random.randint(max(1, min_op // 2), max_op)
-        operation = random.choice(config['operations'])
+        min_op, max_op, operations = self._cfg[difficulty]
+        return self._build(min_op, max_op, operations, difficulty, random.randint, random.choice)
+    
+    @staticmethod
+    def _build(min_op: int, max_op: int, operations: Tuple[str, ...],
+               difficulty: DifficultyLevel, randint, choice) -> MathPuzzle:
+        """Build one puzzle from pre-resolved config and bound random functions"""
+        operation = choice(operations)
         
-        # Calculate correct answer
-        if operation == '+':
-            correct_answer = operand1 + operand2
-        elif operation == '-':
-            correct_answer = operand1 - operand2
-        elif operation == '*':
-            correct_answer = operand1 * operand2
-        elif operation == '/':
-            # Ensure division results in whole number
-            operand2 = max(1, operand1 // (random.randint(2, 5)))
-            correct_answer = operand1 // operand2
+        if operation == '/':
+            # Pick the divisor first so the division is exact
+            divisor = randint(2, 5)
+            quotient = randint(max(1, min_op // divisor), max_op // divisor)
+            operand1 = divisor * quotient
+            operand2 = divisor
+            correct_answer = quotient
+        else:
+            operand1 = randint(min_op, max_op)
+            operand2 = randint(max(1, min_op // 2), max_op)
+            correct_answer = _APPLY[operation](operand1, operand2)
         
         return MathPuzzle(
             operand1=operand1,
@@ -77,4 +91,50 @@ class PuzzleGenerator:
     
     def generate_batch(self, difficulty: DifficultyLevel, count: int) -> list:
         """Generate multiple puzzles"""
-        return [self.generate_puzzle(difficulty) for _ in range(count)]
+        min_op, max_op, operations = self._cfg[difficulty]
+        build = self._build
+        randint = random.randint
+        choice = random.choice
+        return [build(min_op, max_op, operations, difficulty, randint, choice) for _ in range(count)]
+    
+    def generate_batch_arrays(self, difficulty: DifficultyLevel, count: int) -> Dict:
+        """
+        Generate many puzzles at once as parallel arrays, for bulk workloads
+        (curriculum pre-generation, evaluation) that don't need MathPuzzle objects.
+        
+        Requires numpy, which is imported here rather than at module level.
+        
+        Returns:
+            Dict with 'operand1', 'operand2', 'operation' and 'answer' arrays
+        """
+        import numpy as np
+        
+        if self._rng is None:
+            self._rng = np.random.default_rng(self._seed)
+        min_op, max_op, operations = self._cfg[difficulty]
+        rng = self._rng
+        
+        operand1 = rng.integers(min_op, max_op + 1, size=count)
+        operand2 = rng.integers(max(1, min_op // 2), max_op + 1, size=count)
+        operation = np.array(operations)[rng.integers(0, len(operations), size=count)]
+        
+        if '/' in operations:
+            # Pick the divisor first so the division is exact
+            is_div = operation == '/'
+            divisor = rng.integers(2, 6, size=count)
+            quotient = rng.integers(np.maximum(1, min_op // divisor), max_op // divisor + 1)
+            operand1 = np.where(is_div, divisor * quotient, operand1)
+            operand2 = np.where(is_div, divisor, operand2)
+        
+        answer = np.select(
+            [operation == '+', operation == '-', operation == '*'],
+            [operand1 + operand2, operand1 - operand2, operand1 * operand2],
+            default=operand1 // operand2
+        )
+        
+        return {
+            'operand1': operand1,
+            'operand2': operand2,
+            'operation': operation,
+            'answer': answer
+        }
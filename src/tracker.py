@@ -1,32 +1,69 @@
+import time
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Dict
+from itertools import islice
+from typing import List, Dict, NamedTuple
 from enum import Enum
+from puzzle_generator import DifficultyLevel
 
-@dataclass
+def _numpy():
+    """numpy if installed, imported on first use to keep startup light"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+@dataclass(slots=True)
 class PerformanceRecord:
     """Record of a single attempt"""
     puzzle_id: int
-    difficulty: str
+    difficulty: DifficultyLevel
     correct: bool
     time_taken: float  # in seconds
     user_answer: int
     correct_answer: int
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
     
     @property
     def is_correct(self) -> bool:
         return self.correct
 
+class WindowStats(NamedTuple):
+    """Aggregates over the most recent attempts"""
+    correct_count: int
+    total_time: float
+    n: int
+
 class PerformanceTracker:
     """Tracks and analyzes user performance"""
     
-    def __init__(self, user_name: str):
+    def __init__(self, user_name: str, window_size: int = 5):
         self.user_name = user_name
         self.records: List[PerformanceRecord] = []
-        self.session_start = datetime.now()
+        self._session_start_ns = time.monotonic_ns()
+        
+        # Running totals so queries don't rescan self.records
+        self._total_correct = 0
+        self._total_time = 0.0
+        
+        # Per-attempt columns (structure of arrays) for vectorized stats, plus
+        # lazily rebuilt aggregates that log_attempt invalidates: a prefix sum
+        # of correctness for window queries and the per-difficulty stats.
+        # Stdlib arrays so numpy stays optional; numpy views them zero-copy.
+        self._correct = array('b')
+        self._time = array('d')
+        self._diff = array('b')  # DifficultyLevel - 1
+        self._n = 0
+        self._cumsum = None
+        self._difficulty_stats = None
+        
+        # Correctness and time of the last window_size attempts
+        self._recent_correct = deque(maxlen=window_size)
+        self._recent_time = deque(maxlen=window_size)
     
-    def log_attempt(self, puzzle_id: int, difficulty: str, correct: bool, 
+    def log_attempt(self, puzzle_id: int, difficulty: DifficultyLevel, correct: bool, 
                    time_taken: float, user_answer: int, correct_answer: int) -> None:
         """Log a single puzzle attempt"""
         record = PerformanceRecord(
@@ -38,6 +75,32 @@ class PerformanceTracker:
             correct_answer=correct_answer
         )
         self.records.append(record)
+        
+        self._total_correct += correct
+        self._total_time += time_taken
+        
+        self._correct.append(correct)
+        self._time.append(time_taken)
+        self._diff.append(difficulty - 1)
+        self._n += 1
+        self._cumsum = None
+        self._difficulty_stats = None
+        
+        self._recent_correct.append(correct)
+        self._recent_time.append(time_taken)
+    
+    def _window_correct(self, k: int) -> int:
+        """Number of correct answers among the last k attempts"""
+        if k == 0 or self._n == 0:
+            return 0
+        if self._cumsum is None:
+            np = _numpy()
+            if np is None:
+                return sum(self._correct[self._n - k:])
+            self._cumsum = np.cumsum(np.frombuffer(self._correct, dtype=np.int8))
+        end = self._n - 1
+        start = end - k
+        return int(self._cumsum[end] - (self._cumsum[start] if start >= 0 else 0))
     
     def get_accuracy(self, recent_n: int = None) -> float:
         """
@@ -47,41 +110,98 @@ class PerformanceTracker:
         if not self.records:
             return 0.0
         
-        records = self.records[-recent_n:] if recent_n else self.records
-        correct_count = sum(1 for r in records if r.correct)
-        return (correct_count / len(records)) * 100
+        if not recent_n:
+            return (self._total_correct / len(self.records)) * 100
+        
+        if recent_n <= self._recent_correct.maxlen:
+            window = self.window_stats(recent_n)
+            return (window.correct_count / window.n) * 100
+        
+        k = min(recent_n, self._n)
+        return (self._window_correct(k) / k) * 100
     
     def get_average_time(self, recent_n: int = None) -> float:
         """Get average time per puzzle (in seconds)"""
         if not self.records:
             return 0.0
         
-        records = self.records[-recent_n:] if recent_n else self.records
-        total_time = sum(r.time_taken for r in records)
-        return total_time / len(records)
+        if not recent_n:
+            return self._total_time / len(self.records)
+        
+        if recent_n <= self._recent_time.maxlen:
+            window = self.window_stats(recent_n)
+            return window.total_time / window.n
+        
+        k = min(recent_n, self._n)
+        return sum(self._time[self._n - k:]) / k
+    
+    def window_stats(self, k: int = None) -> WindowStats:
+        """
+        Correct count, total time and attempt count over the last k attempts.
+        Defaults to the tracker's window_size.
+        """
+        recent_correct = self._recent_correct
+        recent_time = self._recent_time
+        if k is None or len(recent_correct) <= k <= recent_correct.maxlen:
+            return WindowStats(sum(recent_correct), sum(recent_time), len(recent_correct))
+        
+        if k < len(recent_correct):
+            return WindowStats(
+                sum(islice(reversed(recent_correct), k)),
+                sum(islice(reversed(recent_time), k)),
+                k
+            )
+        
+        k = min(k, self._n)
+        return WindowStats(self._window_correct(k), sum(self._time[self._n - k:]), k)
     
     def get_difficulty_stats(self) -> Dict:
         """Get statistics broken down by difficulty level"""
-        stats = {}
-        for difficulty in ['EASY', 'MEDIUM', 'HARD']:
-            records = [r for r in self.records if r.difficulty == difficulty]
-            if records:
-                correct = sum(1 for r in records if r.correct)
-                avg_time = sum(r.time_taken for r in records) / len(records)
-                stats[difficulty] = {
-                    'attempts': len(records),
-                    'accuracy': (correct / len(records)) * 100,
-                    'avg_time': avg_time
-                }
-        return stats
+        if self._difficulty_stats is None:
+            self._difficulty_stats = self._compute_difficulty_stats()
+        # Copy so callers can't modify the cache
+        return {difficulty: dict(stats) for difficulty, stats in self._difficulty_stats.items()}
+    
+    def _compute_difficulty_stats(self) -> Dict:
+        """Per-difficulty attempts, accuracy and average time"""
+        n_levels = len(DifficultyLevel)
+        np = _numpy()
+        if np is not None:
+            diff = np.frombuffer(self._diff, dtype=np.int8)
+            attempts = np.bincount(diff, minlength=n_levels).tolist()
+            correct = np.bincount(diff, weights=np.frombuffer(self._correct, dtype=np.int8),
+                                  minlength=n_levels).tolist()
+            total_time = np.bincount(diff, weights=np.frombuffer(self._time, dtype=np.float64),
+                                     minlength=n_levels).tolist()
+        else:
+            attempts = [0] * n_levels
+            correct = [0] * n_levels
+            total_time = [0.0] * n_levels
+            for d, c, t in zip(self._diff, self._correct, self._time):
+                attempts[d] += 1
+                correct[d] += c
+                total_time[d] += t
+        
+        return {
+            difficulty: {
+                'attempts': attempts[i],
+                'accuracy': (correct[i] / attempts[i]) * 100,
+                'avg_time': total_time[i] / attempts[i]
+            }
+            for i, difficulty in enumerate(DifficultyLevel)
+            if attempts[i]
+        }
     
     def get_performance_trend(self, window_size: int = 5) -> List[bool]:
         """Get recent performance trend (last window_size attempts)"""
-        return [r.correct for r in self.records[-window_size:]]
+        recent = self._recent_correct
+        if window_size <= recent.maxlen:
+            return list(islice(recent, max(0, len(recent) - window_size), None))
+        return [bool(c) for c in self._correct[max(0, self._n - window_size):]]
     
     def get_session_duration(self) -> float:
         """Get session duration in seconds"""
-        return (datetime.now() - self.session_start).total_seconds()
+        return (time.monotonic_ns() - self._session_start_ns) / 1e9
     
     def get_session_summary(self) -> Dict:
         """Generate complete session summary"""
@@ -93,5 +213,5 @@ class PerformanceTracker:
             'session_duration_seconds': self.get_session_duration(),
             'difficulty_stats': self.get_difficulty_stats(),
             'recent_trend': self.get_performance_trend(),
-            'total_correct': sum(1 for r in self.records if r.correct)
+            'total_correct': self._total_correct
         }
@@ -0,0 +1,86 @@
+import itertools
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from adaptive_engine import AdaptiveEngine, AdaptationConfig, _decide
+from puzzle_generator import DifficultyLevel
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class DecisionTableTest(unittest.TestCase):
+    """The precomputed decision table must agree with the _decide rules"""
+    
+    CONFIGS = [(75, 50), (60, 40), (80, 80), (50, 70), (65, 45), (100, 0)]
+    
+    def _engine(self, high, low):
+        config = AdaptationConfig(
+            rule_based_thresholds={'high': high, 'low': low},
+            min_attempts_before_change=1
+        )
+        return AdaptiveEngine(config=config)
+    
+    def _assert_matches(self, engine, high, low, accuracies, times):
+        for accuracy, avg_time, level in itertools.product(accuracies, times, range(len(DifficultyLevel))):
+            expected = DifficultyLevel(_decide(accuracy, avg_time, level, high, low) + 1)
+            actual = engine._adapt_rule_based(DifficultyLevel(level + 1), accuracy, avg_time, 5)
+            self.assertEqual(actual, expected, (high, low, accuracy, avg_time, level))
+    
+    def test_boundary_values(self):
+        for high, low in self.CONFIGS:
+            engine = self._engine(high, low)
+            accuracies = [0, 100, 33.3, 66.7, high, low]
+            for b in engine.ACCURACY_BREAKPOINTS + (high, low):
+                accuracies += [b - 0.01, b, b + 0.01]
+            times = [0, float('inf')]
+            for b in engine.TIME_BREAKPOINTS:
+                times += [b - 0.01, b, b + 0.01]
+            self._assert_matches(engine, high, low, accuracies, times)
+    
+    def test_random_values(self):
+        rng = random.Random(0)
+        for high, low in self.CONFIGS:
+            engine = self._engine(high, low)
+            accuracies = [rng.uniform(0, 100) for _ in range(100)]
+            times = [rng.uniform(0, 30) for _ in range(100)]
+            self._assert_matches(engine, high, low, accuracies, times)
+
+
+@unittest.skipUnless(numpy, "decide_batch requires numpy")
+class DecideBatchTest(unittest.TestCase):
+    
+    def test_matches_single_decisions(self):
+        engine = AdaptiveEngine(config=AdaptationConfig(min_attempts_before_change=1))
+        rng = random.Random(1)
+        accuracy = [rng.uniform(0, 100) for _ in range(500)]
+        avg_time = [rng.uniform(0, 30) for _ in range(500)]
+        levels = [rng.choice(list(DifficultyLevel)) for _ in range(500)]
+        
+        next_levels = engine.decide_batch(accuracy, avg_time, levels)
+        for a, t, level, next_level in zip(accuracy, avg_time, levels, next_levels):
+            self.assertEqual(next_level, engine._adapt_rule_based(level, a, t, 5))
+    
+    def test_rejects_out_of_range_levels(self):
+        engine = AdaptiveEngine()
+        with self.assertRaises(ValueError):
+            engine.decide_batch([90.0], [5.0], [0])
+    
+    def test_rejects_mismatched_or_non_1d_inputs(self):
+        engine = AdaptiveEngine()
+        with self.assertRaises(ValueError):
+            engine.decide_batch([1.0], [2.0], [1, 2, 3])
+        with self.assertRaises(ValueError):
+            engine.decide_batch([1.0, 2.0, 3.0], [2.0], [1, 2, 3])
+        with self.assertRaises(ValueError):
+            engine.decide_batch(90.0, 5.0, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import operator
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from puzzle_generator import PuzzleGenerator, DifficultyLevel
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+APPLY = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.floordiv}
+
+
+class GeneratePuzzleTest(unittest.TestCase):
+
+    def test_answers_match_expression(self):
+        generator = PuzzleGenerator(seed=0)
+        for difficulty in DifficultyLevel:
+            for puzzle in generator.generate_batch(difficulty, 2000):
+                self.assertIn(puzzle.operation, PuzzleGenerator.DIFFICULTY_CONFIG[difficulty]['operations'])
+                self.assertEqual(
+                    APPLY[puzzle.operation](puzzle.operand1, puzzle.operand2),
+                    puzzle.correct_answer
+                )
+
+    def test_division_is_exact(self):
+        generator = PuzzleGenerator(seed=1)
+        divisions = [
+            generator.generate_puzzle(DifficultyLevel.HARD) for _ in range(5000)
+        ]
+        divisions = [p for p in divisions if p.operation == '/']
+        self.assertTrue(divisions)
+        for puzzle in divisions:
+            self.assertGreaterEqual(puzzle.operand2, 1)
+            self.assertEqual(puzzle.operand1 % puzzle.operand2, 0, str(puzzle))
+            self.assertEqual(puzzle.correct_answer, puzzle.operand1 // puzzle.operand2, str(puzzle))
+
+
+@unittest.skipUnless(numpy, "generate_batch_arrays requires numpy")
+class GenerateBatchArraysTest(unittest.TestCase):
+
+    def test_answers_match_expression(self):
+        generator = PuzzleGenerator(seed=2)
+        for difficulty in DifficultyLevel:
+            batch = generator.generate_batch_arrays(difficulty, 5000)
+            for x, y, op, answer in zip(batch['operand1'].tolist(), batch['operand2'].tolist(),
+                                        batch['operation'].tolist(), batch['answer'].tolist()):
+                self.assertEqual(APPLY[op](x, y), answer)
+
+    def test_division_is_exact(self):
+        generator = PuzzleGenerator(seed=3)
+        batch = generator.generate_batch_arrays(DifficultyLevel.HARD, 20000)
+        is_div = batch['operation'] == '/'
+        self.assertTrue(is_div.any())
+        operand1 = batch['operand1'][is_div]
+        operand2 = batch['operand2'][is_div]
+        self.assertTrue((operand2 >= 1).all())
+        self.assertTrue((operand1 % operand2 == 0).all())
+        self.assertTrue((batch['answer'][is_div] == operand1 // operand2).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
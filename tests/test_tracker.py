@@ -0,0 +1,143 @@
+import os
+import random
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import tracker
+from tracker import PerformanceTracker, WindowStats
+from puzzle_generator import DifficultyLevel
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+WINDOW = 5
+
+
+def _attempts(seed, count):
+    """Deterministic (difficulty, correct, time_taken) attempts"""
+    rng = random.Random(seed)
+    return [
+        (rng.choice(list(DifficultyLevel)), rng.random() < 0.6, rng.uniform(0, 30))
+        for _ in range(count)
+    ]
+
+
+class TrackerQueriesMixin:
+    """
+    Checks every windowed and per-difficulty query against a plain-list
+    reference. Run by subclasses with and without numpy available.
+    """
+
+    def _log(self, t, attempts, start=0):
+        for i, (difficulty, correct, time_taken) in enumerate(attempts, start):
+            t.log_attempt(i, difficulty, correct, time_taken, 0, 0)
+
+    def _window_sizes(self, n):
+        return sorted({1, WINDOW - 1, WINDOW, WINDOW + 1, 2 * WINDOW, n, n + 5})
+
+    def _assert_queries(self, t, attempts):
+        n = len(attempts)
+        correct = [c for _, c, _ in attempts]
+        times = [s for _, _, s in attempts]
+
+        self.assertAlmostEqual(t.get_accuracy(), sum(correct) / n * 100)
+        self.assertAlmostEqual(t.get_average_time(), sum(times) / n)
+
+        for k in self._window_sizes(n):
+            recent_correct = correct[-k:]
+            recent_times = times[-k:]
+            m = len(recent_correct)
+            with self.subTest(n=n, k=k):
+                self.assertAlmostEqual(t.get_accuracy(recent_n=k), sum(recent_correct) / m * 100)
+                self.assertAlmostEqual(t.get_average_time(recent_n=k), sum(recent_times) / m)
+
+                window = t.window_stats(k)
+                self.assertEqual(window.correct_count, sum(recent_correct))
+                self.assertAlmostEqual(window.total_time, sum(recent_times))
+                self.assertEqual(window.n, m)
+
+                self.assertEqual(t.get_performance_trend(k), recent_correct)
+
+        window = t.window_stats()
+        self.assertEqual(window.correct_count, sum(correct[-WINDOW:]))
+        self.assertAlmostEqual(window.total_time, sum(times[-WINDOW:]))
+        self.assertEqual(window.n, len(correct[-WINDOW:]))
+
+    def _assert_difficulty_stats(self, t, attempts):
+        expected = {}
+        for difficulty in DifficultyLevel:
+            rows = [(c, s) for d, c, s in attempts if d == difficulty]
+            if rows:
+                expected[difficulty] = {
+                    'attempts': len(rows),
+                    'accuracy': sum(c for c, _ in rows) / len(rows) * 100,
+                    'avg_time': sum(s for _, s in rows) / len(rows)
+                }
+
+        stats = t.get_difficulty_stats()
+        self.assertEqual(stats.keys(), expected.keys())
+        for difficulty, values in expected.items():
+            self.assertEqual(stats[difficulty]['attempts'], values['attempts'])
+            self.assertAlmostEqual(stats[difficulty]['accuracy'], values['accuracy'])
+            self.assertAlmostEqual(stats[difficulty]['avg_time'], values['avg_time'])
+
+    def test_empty_tracker(self):
+        t = PerformanceTracker('empty', window_size=WINDOW)
+        self.assertEqual(t.get_accuracy(), 0.0)
+        self.assertEqual(t.get_accuracy(recent_n=3), 0.0)
+        self.assertEqual(t.get_average_time(), 0.0)
+        self.assertEqual(t.get_average_time(recent_n=10), 0.0)
+        for k in (None, 1, WINDOW, WINDOW + 5):
+            self.assertEqual(t.window_stats(k), WindowStats(0, 0, 0))
+            self.assertEqual(t.get_performance_trend(k or WINDOW), [])
+        self.assertEqual(t.get_difficulty_stats(), {})
+
+    def test_windowed_queries_as_attempts_grow(self):
+        attempts = _attempts(seed=1, count=40)
+        t = PerformanceTracker('learner', window_size=WINDOW)
+        for n in range(1, len(attempts) + 1):
+            self._log(t, attempts[n - 1:n], start=n - 1)
+            # Query twice so cached aggregates are exercised as well as rebuilt
+            self._assert_queries(t, attempts[:n])
+            self._assert_queries(t, attempts[:n])
+
+    def test_difficulty_stats(self):
+        attempts = _attempts(seed=2, count=60)
+        t = PerformanceTracker('learner', window_size=WINDOW)
+        self._log(t, attempts[:30])
+        self._assert_difficulty_stats(t, attempts[:30])
+        self._log(t, attempts[30:], start=30)
+        self._assert_difficulty_stats(t, attempts)
+
+    def test_difficulty_stats_returns_a_copy(self):
+        attempts = _attempts(seed=3, count=10)
+        t = PerformanceTracker('learner', window_size=WINDOW)
+        self._log(t, attempts)
+        t.get_session_summary()['difficulty_stats'].clear()
+        self._assert_difficulty_stats(t, attempts)
+
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class TrackerWithNumpyTest(TrackerQueriesMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.assertIsNotNone(tracker._numpy())
+
+
+class TrackerWithoutNumpyTest(TrackerQueriesMixin, unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.dict(sys.modules, {'numpy': None})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.assertIsNone(tracker._numpy())
+
+
+if __name__ == '__main__':
+    unittest.main()